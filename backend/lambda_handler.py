@@ -1,5 +1,12 @@
 import os
 from mangum import Mangum
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from main import app
 
 os.environ.setdefault('AWS_LAMBDA_FUNCTION_NAME', 'resume-builder-api')
@@ -5,11 +5,9 @@ FastAPI Resume Builder Backend - AWS Lambda Version
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.responses import StreamingResponse
 import os
+import asyncio
 import logging
-import json
-
-from utils.file_parser import extract_text_from_file
-from utils.ai_parser import stream_resume_processing
+import orjson
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +17,23 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Resume Builder API", version="1.0.0")
 
+# SSE frames are batched with a growing batch size (1, 3, 9, 27, ...) so the
+# first event goes out immediately and later ones amortize the flush cost.
+SSE_DEFAULT_BATCH_SIZE = int(os.environ.get("SSE_DEFAULT_BATCH_SIZE", "1"))
+SSE_GROWTH_FACTOR = int(os.environ.get("SSE_GROWTH_FACTOR", "3"))
+SSE_MAX_BATCH_SIZE = int(os.environ.get("SSE_MAX_BATCH_SIZE", "32"))
+SSE_MAX_FLUSH_DELAY = float(os.environ.get("SSE_MAX_FLUSH_DELAY", "0.02"))
+SSE_FLUSH_IMMEDIATELY = ("final_data", "error")
+
+# Document parsers and the OpenAI client are imported lazily inside the
+# endpoints to keep cold-start init short. Provisioned-concurrency containers
+# are initialised ahead of traffic, so load them eagerly there instead.
+if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") == "provisioned-concurrency":
+    import fitz  # noqa: F401
+    import docx2python  # noqa: F401
+    import utils.file_parser  # noqa: F401
+    import utils.ai_parser  # noqa: F401
+
 @app.get("/")
 async def root():
     return {"message": "Resume Builder API is running"}
@@ -27,36 +42,74 @@ async def root():
 async def stream_resume_processing_endpoint(file: UploadFile = File(...)):
     """Stream resume processing endpoint - Function URL with 5 minute timeout"""
     try:
+        from utils.file_parser import extract_text_from_bytes
+        from utils.ai_parser import stream_resume_processing
+
         logger.info(f"Processing file: {file.filename} ({file.content_type})")
         
-        temp_file_path = f"/tmp/{file.filename}"
         content = await file.read()
-        with open(temp_file_path, "wb") as temp_file:
-            temp_file.write(content)
-
-        try:
-            # Extract text from file - no timeout worries with Function URLs
-            extracted_text = extract_text_from_file(temp_file_path)
-
-
-            async def generate_stream():
-                async for chunk in stream_resume_processing(extracted_text):
-                    yield f"data: {json.dumps(chunk)}\n\n"
-                yield "data: [DONE]\n\n"
-
-            return StreamingResponse(
-                generate_stream(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive"
-                }
-            )
-        finally:
+        file_extension = os.path.splitext(file.filename or "")[1]
+
+        # Extract text from file - no timeout worries with Function URLs
+        extracted_text = extract_text_from_bytes(content, file_extension)
+
+
+        async def generate_stream():
+            loop = asyncio.get_running_loop()
+            events = stream_resume_processing(extracted_text)
+            buffer = []
+            next_flush_size = SSE_DEFAULT_BATCH_SIZE
+            first_buffered_at = 0.0
+            pending = None
+
             try:
-                os.unlink(temp_file_path)
-            except Exception as cleanup_error:
-                logger.error(f"❌ Error cleaning up temp file: {cleanup_error}")
+                while True:
+                    if pending is None:
+                        pending = asyncio.ensure_future(events.__anext__())
+
+                    # Buffered frames wait at most SSE_MAX_FLUSH_DELAY for the next
+                    # event; asyncio.wait (unlike wait_for) leaves the upstream
+                    # generator running when the deadline passes.
+                    if buffer:
+                        remaining = first_buffered_at + SSE_MAX_FLUSH_DELAY - loop.time()
+                        done, _ = await asyncio.wait({pending}, timeout=max(remaining, 0))
+                        if not done:
+                            payload = b"".join(buffer)
+                            buffer.clear()
+                            next_flush_size = min(next_flush_size * SSE_GROWTH_FACTOR, SSE_MAX_BATCH_SIZE)
+                            yield payload
+                            continue
+
+                    try:
+                        chunk = await pending
+                    except StopAsyncIteration:
+                        pending = None
+                        break
+                    pending = None
+
+                    if not buffer:
+                        first_buffered_at = loop.time()
+                    buffer.append(b"data: " + orjson.dumps(chunk) + b"\n\n")
+                    if len(buffer) >= next_flush_size or chunk.get('type') in SSE_FLUSH_IMMEDIATELY:
+                        payload = b"".join(buffer)
+                        buffer.clear()
+                        next_flush_size = min(next_flush_size * SSE_GROWTH_FACTOR, SSE_MAX_BATCH_SIZE)
+                        yield payload
+            finally:
+                if pending is not None:
+                    pending.cancel()
+
+            buffer.append(b"data: [DONE]\n\n")
+            yield b"".join(buffer)
+
+        return StreamingResponse(
+            generate_stream(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive"
+            }
+        )
 
     except Exception as e:
         logger.error(f"❌ Error in streaming processing: {e}")
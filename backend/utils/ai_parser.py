@@ -1,7 +1,9 @@
 import os
 import re
 import json
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Any, Optional, AsyncGenerator
 from openai import AsyncOpenAI
@@ -19,6 +21,43 @@ if not api_key:
 
 client = AsyncOpenAI(api_key=api_key)
 
+# Parsed resumes keyed by a hash of the extracted text, kept for the lifetime
+# of the (warm) Lambda container so retries of the same upload skip OpenAI.
+RESUME_CACHE_SIZE = int(os.getenv('RESUME_CACHE_SIZE', '32'))
+_resume_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def get_resume_cache_key(text: str) -> str:
+    """
+    Build the cache key for an extracted resume text
+
+    Args:
+        text: Extracted resume text
+
+    Returns:
+        Hex digest identifying the text
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def get_cached_resume(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up parsed resume data in the in-memory cache
+    """
+    data = _resume_cache.get(key)
+    if data is not None:
+        _resume_cache.move_to_end(key)
+    return data
+
+def cache_resume(key: str, data: Dict[str, Any]) -> None:
+    """
+    Store parsed resume data, evicting the least recently used entry when full
+    """
+    if RESUME_CACHE_SIZE <= 0:
+        return
+    _resume_cache[key] = data
+    _resume_cache.move_to_end(key)
+    while len(_resume_cache) > RESUME_CACHE_SIZE:
+        _resume_cache.popitem(last=False)
+
 async def extract_data_from_text(text: str) -> Dict[str, Any]:
     logger.info('\n=== AI PARSER: Starting OpenAI extraction with function calling ===')
     logger.info(f'Text length: {len(text)} characters')
@@ -314,6 +353,25 @@ async def stream_resume_processing(extracted_text: str) -> AsyncGenerator[Dict[s
     logger.info('\n=== STREAMING AI PARSER: Starting resume processing ===')
     
     try:
+        cache_key = get_resume_cache_key(extracted_text)
+        cached_data = get_cached_resume(cache_key)
+        if cached_data is not None:
+            logger.info(f'✅ Resume cache hit: {cache_key}')
+            yield {
+                'type': 'final_data',
+                'data': cached_data,
+                'message': 'Final resume data ready',
+                'progress': 98,
+                'timestamp': datetime.now().isoformat()
+            }
+            yield {
+                'type': 'complete',
+                'message': 'Resume processing completed successfully!',
+                'progress': 100,
+                'timestamp': datetime.now().isoformat()
+            }
+            return
+
         yield {
             'type': 'progress',
             'message': 'Analyzing resume structure...',
@@ -357,6 +415,10 @@ async def stream_resume_processing(extracted_text: str) -> AsyncGenerator[Dict[s
             }
             return
 
+        # Don't cache the empty fallback returned when the tool call JSON was invalid
+        if full_resume_data != get_default_resume_structure():
+            cache_resume(cache_key, full_resume_data)
+
         yield {
             'type': 'final_data',
             'data': full_resume_data,
@@ -4,6 +4,41 @@ from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+SECTION_KEYWORDS = {
+    'summary': [
+        'summary', 'experience summary', 'professional summary', 'professional background',
+        'profile', 'professional profile', 'career summary', 'career profile',
+        'executive summary', 'technical summary', 'overview', 'profile summary'
+    ],
+    'experience': [
+        'experience', 'work experience', 'employment', 'professional experience',
+        'work history', 'career history', 'employment history'
+    ],
+    'education': [
+        'education', 'educational background', 'academic background', 'academic history',
+        'academic qualification', 'academic qualifications'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'core competencies', 'key skills',
+        'areas of expertise', 'skills summary'
+    ],
+    'certifications': [
+        'certifications', 'certification', 'certified'
+    ]
+}
+
+HTML_TAG_PATTERN = re.compile(r'</?[^>]+(>|$)')
+UPPERCASE_START_PATTERN = re.compile(r'^[A-Z]')
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'(\+\d{1,3}[-\s]?)?(\(?\d{3}\)?[-\s]?)?\d{3}[-\s]?\d{4}')
+LINKEDIN_URL_PATTERN = re.compile(r'https?://(www\.)?linkedin\.com/in/[^\s]+')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[^\s]+')
+
+CERT_KEYWORDS = (
+    'certified', 'certification', 'certificate', 'license', 'credential',
+    'awarded', 'accredited', 'qualified', 'diploma'
+)
+
 def chunk_resume_from_bold_headings(raw_text: str) -> Dict[str, str]:
     """
     Chunk resume from bold headings
@@ -20,29 +55,6 @@ def chunk_resume_from_bold_headings(raw_text: str) -> Dict[str, str]:
     logger.info(f'Total raw text length: {len(raw_text)} characters')
     logger.info('===================================\n')
     
-    section_keywords = {
-        'summary': [
-            'summary', 'experience summary', 'professional summary', 'professional background',
-            'profile', 'professional profile', 'career summary', 'career profile',
-            'executive summary', 'technical summary', 'overview', 'profile summary'
-        ],
-        'experience': [
-            'experience', 'work experience', 'employment', 'professional experience',
-            'work history', 'career history', 'employment history'
-        ],
-        'education': [
-            'education', 'educational background', 'academic background', 'academic history',
-            'academic qualification', 'academic qualifications'
-        ],
-        'skills': [
-            'skills', 'technical skills', 'core competencies', 'key skills',
-            'areas of expertise', 'skills summary'
-        ],
-        'certifications': [
-            'certifications', 'certification', 'certified'
-        ]
-    }
-    
     sections = {
         'header': "",
         'summary': "",
@@ -53,7 +65,7 @@ def chunk_resume_from_bold_headings(raw_text: str) -> Dict[str, str]:
     }
     
 
-    all_matches = find_sections_by_words(raw_text, section_keywords)
+    all_matches = find_sections_by_words(raw_text, SECTION_KEYWORDS)
     logger.info(f'Found {len(all_matches)} section matches')
     
     logger.info("\n=== ALL SECTION MATCHES ===")
@@ -67,7 +79,7 @@ def chunk_resume_from_bold_headings(raw_text: str) -> Dict[str, str]:
     if all_matches:
         first_heading = all_matches[0]
         header_content = raw_text[:first_heading['start']].strip()
-        clean_header_text = re.sub(r'</?[^>]+(>|$)', '', header_content)
+        clean_header_text = HTML_TAG_PATTERN.sub('', header_content)
         sections['header'] = clean_header_text
         
         logger.info('\n=== HEADER SECTION EXTRACTED ===')
@@ -86,7 +98,7 @@ def chunk_resume_from_bold_headings(raw_text: str) -> Dict[str, str]:
         this_heading = all_matches[i]
         next_heading = all_matches[i + 1]
         chunk_content = raw_text[this_heading['end']:next_heading['start']].strip()
-        clean_text = re.sub(r'</?[^>]+(>|$)', '', chunk_content)
+        clean_text = HTML_TAG_PATTERN.sub('', chunk_content)
         sections[this_heading['section_key']] += clean_text + "\n"
 
     extract_certifications_from_text(raw_text, sections)
@@ -120,7 +132,7 @@ def find_sections_by_words(raw_text: str, section_keywords: Dict[str, List[str]]
     """
     matches = []
     
-    clean_text = re.sub(r'</?[^>]+(>|$)', '', raw_text)
+    clean_text = HTML_TAG_PATTERN.sub('', raw_text)
     lines = clean_text.split('\n')
     
     current_position = 0
@@ -222,7 +234,7 @@ def is_line_standalone(line: str, all_lines: List[str], line_index: int) -> bool
     
     # Should have some spacing around it or be at document boundaries
     has_spacing_before = not prev_line or prev_line == '' or prev_line.endswith('.') or prev_line.endswith(':')
-    has_spacing_after = not next_line or next_line == '' or re.match(r'^[A-Z]', next_line)
+    has_spacing_after = not next_line or next_line == '' or UPPERCASE_START_PATTERN.match(next_line)
     
     return has_spacing_before or has_spacing_after
 
@@ -367,25 +379,21 @@ def sanitize_sensitive_info(sections: Dict[str, str]) -> Dict[str, str]:
 
         sanitized_content = content
 
-        sanitized_content = re.sub(
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+        sanitized_content = EMAIL_PATTERN.sub(
             '[EMAIL REDACTED]',
             sanitized_content
         )
 
-        sanitized_content = re.sub(
-            r'(\+\d{1,3}[-\s]?)?(\(?\d{3}\)?[-\s]?)?\d{3}[-\s]?\d{4}',
+        sanitized_content = PHONE_PATTERN.sub(
             '[PHONE REDACTED]',
             sanitized_content
         )
 
-        sanitized_content = re.sub(
-            r'https?://(www\.)?linkedin\.com/in/[^\s]+',
+        sanitized_content = LINKEDIN_URL_PATTERN.sub(
             '[LINKEDIN REDACTED]',
             sanitized_content
         )
-        sanitized_content = re.sub(
-            r'linkedin\.com/in/[^\s]+',
+        sanitized_content = LINKEDIN_PATTERN.sub(
             '[LINKEDIN REDACTED]',
             sanitized_content
         )
@@ -413,25 +421,20 @@ def extract_certifications_from_text(raw_text: str, sections: Dict[str, str]) ->
         sections: Sections dictionary to update
     """
 
-    clean_text = re.sub(r'</?[^>]+(>|$)', '', raw_text)
+    clean_text = HTML_TAG_PATTERN.sub('', raw_text)
 
     lines = clean_text.split('\n')
 
 
-    cert_keywords = [
-        'certified', 'certification', 'certificate', 'license', 'credential',
-        'awarded', 'accredited', 'qualified', 'diploma'
-    ]
-
     certification_lines = []
     for line in lines:
-        lower_line = line.lower().strip()
-        if len(lower_line) < 5:
+        stripped_line = line.strip()
+        if len(stripped_line) < 5:
             continue
 
-
-        if any(keyword in lower_line for keyword in cert_keywords):
-            certification_lines.append(line.strip())
+        lower_line = stripped_line.lower()
+        if any(keyword in lower_line for keyword in CERT_KEYWORDS):
+            certification_lines.append(stripped_line)
 
 
     if certification_lines:
@@ -3,39 +3,40 @@ File Parser Utilities for FastAPI Resume Builder Backend
 Direct document parsing without subprocess
 """
 
-import os
+import io
 import logging
-from docx2python import docx2python
-import fitz  
 
 logger = logging.getLogger(__name__)
 
-def extract_text_from_file(file_path: str) -> str:
+W_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_PARAGRAPH = W_NAMESPACE + 'p'
+W_TEXT = W_NAMESPACE + 't'
+W_TAB = W_NAMESPACE + 'tab'
+W_TAB_STOPS = W_NAMESPACE + 'tabs'
+W_LINE_BREAKS = (W_NAMESPACE + 'br', W_NAMESPACE + 'cr')
+
+def extract_text_from_bytes(data: bytes, file_extension: str) -> str:
     """
-    Extract text from uploaded file using direct parsing
+    Extract text from an in-memory upload using direct parsing
     
     Args:
-        file_path: Path to the uploaded file
+        data: Raw file content
+        file_extension: File extension including the dot, in any case (e.g. '.pdf' or '.PDF')
         
     Returns:
         Extracted text content
     """
-    file_extension = os.path.splitext(file_path)[1].lower()
-    logger.info(f'🔍 Processing file: {file_path} (extension: {file_extension})')
-
-
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    file_size = os.path.getsize(file_path)
-    logger.info(f'📊 File size: {file_size} bytes')
+    file_extension = file_extension.lower()
+    logger.info(f'🔍 Processing file (extension: {file_extension})')
+    logger.info(f'📊 File size: {len(data)} bytes')
 
     try:
         if file_extension == '.docx':
             logger.info('🔄 Using docx2python for DOCX extraction...')
             try:
-   
-                doc = docx2python(file_path)
+                from docx2python import docx2python
+
+                doc = docx2python(io.BytesIO(data))
                 text = doc.text
                 doc.close()
                 logger.info(f'✅ DOCX extraction successful - Text length: {len(text)} characters')
@@ -49,17 +50,43 @@ def extract_text_from_file(file_path: str) -> str:
                     import zipfile
                     from xml.etree import ElementTree as ET
 
-                    with zipfile.ZipFile(file_path, 'r') as docx_zip:
-
-                        doc_xml = docx_zip.read('word/document.xml')
-                        root = ET.fromstring(doc_xml)
+                    with zipfile.ZipFile(io.BytesIO(data), 'r') as docx_zip:
 
-                        text_elements = []
-                        for elem in root.iter():
-                            if elem.text:
-                                text_elements.append(elem.text)
+                        # Rebuild text per paragraph from w:t runs, tabs and line breaks.
+                        # Text-box paragraphs nest inside an outer w:p, so keep one run list
+                        # per open paragraph. w:tab inside w:tabs is a tab-stop definition,
+                        # not content. document.xml is parsed straight from the zip stream,
+                        # and each paragraph is cleared once read.
+                        paragraphs = []
+                        open_runs = []
+                        tab_stops_depth = 0
+                        with docx_zip.open('word/document.xml') as doc_xml:
+                            for event, elem in ET.iterparse(doc_xml, events=('start', 'end')):
+                                tag = elem.tag
+                                if event == 'start':
+                                    if tag == W_PARAGRAPH:
+                                        open_runs.append([])
+                                    elif tag == W_TAB_STOPS:
+                                        tab_stops_depth += 1
+                                elif tag == W_PARAGRAPH:
+                                    runs = open_runs.pop()
+                                    if runs:
+                                        paragraphs.append(''.join(runs))
+                                    elem.clear()
+                                elif tag == W_TAB_STOPS:
+                                    tab_stops_depth -= 1
+                                elif not open_runs:
+                                    continue
+                                elif tag == W_TEXT:
+                                    if elem.text:
+                                        open_runs[-1].append(elem.text)
+                                elif tag == W_TAB:
+                                    if not tab_stops_depth:
+                                        open_runs[-1].append('\t')
+                                elif tag in W_LINE_BREAKS:
+                                    open_runs[-1].append('\n')
 
-                        text = ' '.join(text_elements)
+                        text = '\n'.join(paragraphs)
                         logger.info(f'✅ Alternative DOCX extraction successful - Text length: {len(text)} characters')
                         return text
 
@@ -69,21 +96,20 @@ def extract_text_from_file(file_path: str) -> str:
             
         elif file_extension == '.pdf':
             logger.info('🔄 Using PyMuPDF for PDF extraction...')
-            doc = fitz.open(file_path)
-            text = ""
-            for page_num, page in enumerate(doc):
-                page_text = page.get_text()
-                text += page_text + "\n"
+            import fitz
+
+            with fitz.open(stream=data, filetype="pdf") as doc:
+                page_texts = [page.get_text() for page in doc]
+            for page_num, page_text in enumerate(page_texts):
                 logger.info(f'📄 Page {page_num + 1} extracted {len(page_text)} characters')
-            doc.close()
+            text = "".join(f"{page_text}\n" for page_text in page_texts)
             logger.info(f'✅ PDF extraction successful - Total text length: {len(text)} characters')
             logger.info(f'📝 First 500 characters: {text[:500]}...')
             return text
             
         elif file_extension == '.txt':
             logger.info('🔄 Reading TXT file...')
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
+            text = data.decode('utf-8')
             logger.info('✅ TXT extraction successful')
             return text
             